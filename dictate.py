@@ -6,31 +6,104 @@ Hold the hotkey to record, release to transcribe and copy to clipboard.
 
 import argparse
 import configparser
+import functools
 import subprocess
-import tempfile
 import threading
+import shutil
 import signal
 import sys
 import os
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import ctranslate2
+import numpy as np
 from pynput import keyboard
 from faster_whisper import WhisperModel
+from faster_whisper.vad import get_speech_timestamps
+
+try:
+    from jeepney import DBusAddress, new_method_call, unwrap_msg
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    # Optional: without jeepney, notifications go through notify-send
+    open_dbus_connection = None
 
 __version__ = "0.1.0"
 
+SAMPLE_RATE = 16000  # What Whisper expects
+PCM_SCALE = np.float32(1 / 32768)  # 16-bit PCM -> float32 in [-1, 1]
+MIN_RECORDING_SECONDS = 0.3  # Shorter presses are treated as accidental taps
+
 # Load configuration
 CONFIG_PATH = Path.home() / ".config" / "soupawhisper" / "config.ini"
 
 
-def load_config():
+# Preferred compute types per device, fastest first
+COMPUTE_TYPE_PREFERENCES = {
+    "cpu": ["int8", "float32"],
+    "cuda": ["int8_float16", "float16", "float32"],
+}
+
+
+def resolve_compute_type(device, compute_type):
+    """Pick a compute type the device supports, preferring the fastest one."""
+    try:
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception as e:
+        print(f"Could not query supported compute types for {device}: {e}")
+        supported = None
+
+    if compute_type != "auto":
+        if supported is None or compute_type in supported:
+            return compute_type
+        print(f"Compute type {compute_type} is not supported on {device}, selecting automatically")
+
+    # Unknown devices are left to CTranslate2's own default
+    for candidate in COMPUTE_TYPE_PREFERENCES.get(device, []):
+        if supported is None or candidate in supported:
+            return candidate
+    return "default"
+
+
+# Use native Wayland tools when available instead of going through XWayland
+IS_WAYLAND = os.environ.get("XDG_SESSION_TYPE") == "wayland"
+CLIPBOARD_CMD = ["wl-copy"] if IS_WAYLAND else ["xclip", "-selection", "clipboard"]
+TYPE_CMD = ["wtype", "-"] if IS_WAYLAND else ["xdotool", "type", "--clearmodifiers", "--delay", "0", "--file", "-"]
+# Command -> package providing it
+CLIPBOARD_PKG = ("wl-copy", "wl-clipboard") if IS_WAYLAND else ("xclip", "xclip")
+TYPE_PKG = ("wtype", "wtype") if IS_WAYLAND else ("xdotool", "xdotool")
+
+NOTIFICATIONS_ADDRESS = "/org/freedesktop/Notifications"
+NOTIFICATIONS_INTERFACE = "org.freedesktop.Notifications"
+
+# Inference backends: ctranslate2 (faster-whisper) works everywhere,
+# the others are CUDA-only and need extra packages
+BACKENDS = ("ctranslate2", "whisper_s2t_trt", "transformers_fa2")
+
+# Distilled models: far fewer decoder layers, used as-is (no .en suffix)
+DISTIL_MODELS = {"distil-small.en", "distil-medium.en", "distil-large-v2", "distil-large-v3"}
+
+
+@functools.cache
+def get_config():
+    """Load the config file on first use; later calls return the cached result."""
     config = configparser.ConfigParser()
 
     # Defaults
     defaults = {
         "model_size": "base",
         "device": "cpu",
-        "compute_type": "int8",
+        "compute_type": "auto",
+        "beam_size": "1",
+        # Roughly one thread per physical core
+        "cpu_threads": str(max(1, (os.cpu_count() or 2) // 2)),
+        "num_workers": "1",
+        "backend": "ctranslate2",
+        "share_multilingual": "false",
+        "assistant_model": "",
         "key": "f12",
         "auto_type": "true",
         "notifications": "true",
@@ -40,15 +113,25 @@ def load_config():
         config.read(CONFIG_PATH)
 
     model_size = config.get("whisper", "model_size", fallback=defaults["model_size"])
+    share_multilingual = config.getboolean(
+        "whisper", "share_multilingual", fallback=defaults["share_multilingual"] == "true"
+    )
 
     # Load language configurations
     # Format: lang = hotkey
     # Model is determined automatically: .en for English, multilingual for others
     languages = {}
     if config.has_section("languages"):
-        for lang, hotkey in config.items("languages"):
+        language_items = config.items("languages")
+        # Only worth sharing if a multilingual model is needed anyway
+        use_shared_model = share_multilingual and any(lang != "en" for lang, _ in language_items)
+        for lang, hotkey in language_items:
             # Use .en model for English (faster/more accurate), multilingual for others
-            if lang == "en":
+            if model_size in DISTIL_MODELS:
+                model = model_size
+                if lang != "en":
+                    print(f"Warning: {model_size} is trained for English only, {lang} may transcribe poorly")
+            elif lang == "en" and not use_shared_model:
                 model = f"{model_size}.en"
             else:
                 model = model_size
@@ -60,19 +143,57 @@ def load_config():
             "model": model_size
         }
 
+    device = config.get("whisper", "device", fallback=defaults["device"]).strip().lower()
+    if device == "auto":
+        # Resolve to the real device so the compute type can be picked for it
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    compute_type = resolve_compute_type(
+        device,
+        config.get("whisper", "compute_type", fallback=defaults["compute_type"]).strip().lower()
+    )
+
+    backend = config.get("whisper", "backend", fallback=defaults["backend"]).strip().lower()
+    if backend not in BACKENDS:
+        print(f"Unknown backend: {backend}, defaulting to {defaults['backend']}")
+        backend = defaults["backend"]
+    elif backend != "ctranslate2" and device != "cuda":
+        print(f"Backend {backend} requires device = cuda, falling back to {defaults['backend']}")
+        backend = defaults["backend"]
+    elif backend == "whisper_s2t_trt" and "auto" in languages:
+        # WhisperS2T can't detect the language and would force English
+        print(f"Backend {backend} does not support language auto-detection, "
+              f"falling back to {defaults['backend']}. Configure a [languages] section to use it.")
+        backend = defaults["backend"]
+
+    # Speculative decoding needs transformers, CTranslate2 doesn't support it
+    assistant_model = config.get("whisper", "assistant_model", fallback=defaults["assistant_model"]).strip()
+    if assistant_model:
+        if device != "cuda":
+            print(f"Assistant model {assistant_model} requires device = cuda, ignoring it")
+            assistant_model = None
+        elif not any(assistant_matches(cfg["model"], assistant_model) for cfg in languages.values()):
+            print(f"Assistant model {assistant_model} does not match any configured model, ignoring it")
+            assistant_model = None
+        elif backend != "transformers_fa2":
+            print(f"Assistant model {assistant_model} requires backend transformers_fa2, switching backend")
+            backend = "transformers_fa2"
+    assistant_model = assistant_model or None
+
     return {
         "model_size": model_size,
-        "device": config.get("whisper", "device", fallback=defaults["device"]),
-        "compute_type": config.get("whisper", "compute_type", fallback=defaults["compute_type"]),
+        "device": device,
+        "compute_type": compute_type,
+        "backend": backend,
+        "assistant_model": assistant_model,
+        "beam_size": config.getint("whisper", "beam_size", fallback=int(defaults["beam_size"])),
+        "cpu_threads": config.getint("whisper", "cpu_threads", fallback=int(defaults["cpu_threads"])),
+        "num_workers": config.getint("whisper", "num_workers", fallback=int(defaults["num_workers"])),
         "languages": languages,
         "auto_type": config.getboolean("behavior", "auto_type", fallback=True),
         "notifications": config.getboolean("behavior", "notifications", fallback=True),
     }
 
 
-CONFIG = load_config()
-
-
 def get_hotkey(key_name):
     """Map key name to pynput key."""
     key_name = key_name.lower()
@@ -85,23 +206,121 @@ def get_hotkey(key_name):
         return keyboard.Key.f12
 
 
-# Build hotkey-to-language mapping with model info
-HOTKEY_TO_LANG = {}
-for lang, lang_config in CONFIG["languages"].items():
-    hotkey = get_hotkey(lang_config["key"])
-    HOTKEY_TO_LANG[hotkey] = {"lang": lang, "model": lang_config["model"]}
+def build_hotkey_map(languages):
+    """Build hotkey-to-language mapping with model info."""
+    hotkey_to_lang = {}
+    for lang, lang_config in languages.items():
+        hotkey = get_hotkey(lang_config["key"])
+        hotkey_to_lang[hotkey] = {"lang": lang, "model": lang_config["model"]}
+    return hotkey_to_lang
+
+
+Segment = namedtuple("Segment", ["text"])
+
+
+def hf_model_id(model_name):
+    """Map a model name to its Hugging Face transformers checkpoint."""
+    if model_name.startswith("distil-"):
+        return f"distil-whisper/{model_name}"
+    return f"openai/whisper-{model_name}"
+
+
+class WhisperS2TModel:
+    """WhisperS2T on TensorRT-LLM, with a faster-whisper style transcribe()."""
+
+    def __init__(self, model_name):
+        import whisper_s2t
+
+        self.model = whisper_s2t.load_model(model_identifier=model_name, backend="TensorRT-LLM")
+
+    def transcribe(self, audio, language=None, **kwargs):
+        return self.transcribe_batch([audio], [language])[0], None
+
+    def transcribe_batch(self, audios, languages):
+        # WhisperS2T needs an explicit language; get_config() rules out auto-detect,
+        # this only covers direct calls such as the warm-up
+        languages = [lang if lang and lang != "auto" else "en" for lang in languages]
+        out = self.model.transcribe_with_vad(
+            audios,
+            lang_codes=languages,
+            tasks=["transcribe"] * len(audios),
+            initial_prompts=[None] * len(audios),
+            batch_size=len(audios),
+        )
+        return [[Segment(item["text"]) for item in result] for result in out]
+
+
+def assistant_matches(model_name, assistant_model_name):
+    """Whether an assistant can draft for a model: distil-large-vN pairs with
+    large-vN, which share the mel bins and vocabulary."""
+    return (
+        assistant_model_name.startswith("distil-large-v")
+        and model_name == assistant_model_name[len("distil-"):]
+    )
+
+
+def load_assistant_model(assistant_model_name):
+    """Load a transformers model to use as speculative decoding assistant."""
+    import torch
+    from transformers import AutoModelForSpeechSeq2Seq
 
-DEVICE = CONFIG["device"]
-COMPUTE_TYPE = CONFIG["compute_type"]
-AUTO_TYPE = CONFIG["auto_type"]
-NOTIFICATIONS = CONFIG["notifications"]
+    return AutoModelForSpeechSeq2Seq.from_pretrained(
+        hf_model_id(assistant_model_name),
+        torch_dtype=torch.float16,
+        attn_implementation="flash_attention_2",
+    ).to("cuda:0")
+
+
+class TransformersModel:
+    """Hugging Face transformers pipeline with FlashAttention-2, with a
+    faster-whisper style transcribe(). An optional assistant model enables
+    speculative decoding."""
+
+    def __init__(self, model_name, assistant=None):
+        import torch
+        from transformers import pipeline
+
+        self.assistant = assistant
+        self.pipe = pipeline(
+            "automatic-speech-recognition",
+            model=hf_model_id(model_name),
+            torch_dtype=torch.float16,
+            device="cuda:0",
+            model_kwargs={"attn_implementation": "flash_attention_2"},
+        )
+
+    def transcribe(self, audio, language=None, beam_size=1, vad_filter=False, **kwargs):
+        # The pipeline has no VAD and hallucinates text on silence, so use
+        # faster-whisper's Silero VAD to skip audio without speech
+        if vad_filter and not get_speech_timestamps(audio):
+            return [], None
+
+        generate_kwargs = {"num_beams": beam_size}
+        if self.assistant is not None:
+            # Speculative decoding only supports greedy search
+            generate_kwargs = {"num_beams": 1, "assistant_model": self.assistant}
+        if language:
+            generate_kwargs["language"] = language
+        result = self.pipe(
+            {"raw": audio, "sampling_rate": SAMPLE_RATE},
+            chunk_length_s=30,
+            generate_kwargs=generate_kwargs,
+        )
+        return [Segment(result["text"])], None
 
 
 class Dictation:
     def __init__(self):
+        self.config = get_config()
+        self.hotkey_to_lang = build_hotkey_map(self.config["languages"])
+        self.hotkeys = frozenset(self.hotkey_to_lang)
+
         self.recording = False
         self.record_process = None
-        self.temp_file = None
+        self.record_thread = None
+        self.audio_buffer = None
+        # Reused float32 conversion buffer for recordings up to a minute
+        self.audio_f32 = np.empty(SAMPLE_RATE * 60, dtype=np.float32)
         self.running = True
         self.active_language = None  # Track which language hotkey is pressed
         self.active_model_name = None  # Track which model to use
@@ -110,17 +329,40 @@ class Dictation:
         self.models = {}
         self.models_lock = threading.Lock()
 
+        # Speculative decoding assistant, loaded once and shared by all models
+        self.assistant = None
+        self.assistant_loaded = False
+        self.assistant_lock = threading.Lock()
+
+        # Session bus connection for notifications, or None to use notify-send
+        self.dbus = None
+        self.dbus_lock = threading.Lock()
+        self.notification_id = 0
+        if self.config["notifications"] and open_dbus_connection:
+            try:
+                self.dbus = open_dbus_connection(bus="SESSION")
+            except Exception as e:
+                print(f"Could not connect to D-Bus, using notify-send: {e}")
+
+        # Finished recordings waiting to be transcribed: (audio, language, model_name)
+        self.pending = queue.Queue()
+
         # Print configured hotkeys
         print("Configured languages:")
-        for hotkey, config in HOTKEY_TO_LANG.items():
+        for hotkey, config in self.hotkey_to_lang.items():
             key_name = hotkey.name if hasattr(hotkey, 'name') else hotkey.char
             lang = config["lang"]
             model = config["model"]
             lang_display = "auto-detect" if lang == "auto" else lang.upper()
             print(f"  [{key_name}] → {lang_display} (model: {model})")
-        print("Models will be loaded on first use.")
         print("Press Ctrl+C to quit.")
 
+        # Preload all configured models in parallel so the first press doesn't wait
+        for model_name in sorted(set(cfg["model"] for cfg in self.hotkey_to_lang.values())):
+            self._get_or_load_model(model_name)
+
+        threading.Thread(target=self._transcription_worker, daemon=True).start()
+
     def _get_or_load_model(self, model_name):
         """Get a model from cache or load it if not yet loaded."""
         with self.models_lock:
@@ -141,22 +383,83 @@ class Dictation:
     def _load_model(self, model_name):
         """Load a specific model."""
         model_info = self.models[model_name]
-        print(f"Loading Whisper model ({model_name})...")
+        backend = self.config["backend"]
+        print(f"Loading Whisper model ({model_name}, backend: {backend})...")
         try:
-            model_info["model"] = WhisperModel(model_name, device=DEVICE, compute_type=COMPUTE_TYPE)
+            if backend == "whisper_s2t_trt":
+                model_info["model"] = WhisperS2TModel(model_name)
+            elif backend == "transformers_fa2":
+                model_info["model"] = TransformersModel(model_name, self._get_assistant_for(model_name))
+            else:
+                model_info["model"] = WhisperModel(
+                    model_name,
+                    device=self.config["device"],
+                    compute_type=self.config["compute_type"],
+                    cpu_threads=self.config["cpu_threads"],
+                    num_workers=self.config["num_workers"],
+                )
             print(f"Model {model_name} loaded.")
+            self._warm_up_model(model_name, model_info["model"])
         except Exception as e:
             model_info["error"] = str(e)
             print(f"Failed to load model {model_name}: {e}")
             if "cudnn" in str(e).lower() or "cuda" in str(e).lower():
                 print("Hint: Try setting device = cpu in your config, or install cuDNN.")
+            if isinstance(e, ImportError):
+                print(f"Hint: Install the packages for backend {backend}, or set backend = ctranslate2.")
         finally:
             model_info["loaded"].set()
 
+    def _get_assistant_for(self, model_name):
+        """Get the shared assistant model if it can draft for this model."""
+        assistant_model_name = self.config["assistant_model"]
+        if not assistant_model_name:
+            return None
+        if not assistant_matches(model_name, assistant_model_name):
+            print(f"Assistant model {assistant_model_name} does not match {model_name}, "
+                  f"speculative decoding disabled for it")
+            return None
+
+        with self.assistant_lock:
+            if not self.assistant_loaded:
+                self.assistant_loaded = True
+                print(f"Loading assistant model ({assistant_model_name})...")
+                try:
+                    self.assistant = load_assistant_model(assistant_model_name)
+                    print(f"Assistant model {assistant_model_name} loaded.")
+                except Exception as e:
+                    print(f"Failed to load assistant model {assistant_model_name}, "
+                          f"speculative decoding disabled: {e}")
+        return self.assistant
+
+    def _warm_up_model(self, model_name, model):
+        """Run a short silent clip through the model so the first real
+        transcription doesn't pay for kernel selection and allocations."""
+        try:
+            silence = np.zeros(SAMPLE_RATE // 2, dtype=np.float32)
+            segments, _ = model.transcribe(silence, beam_size=1, vad_filter=False)
+            list(segments)
+            if not isinstance(model, WhisperS2TModel):
+                # The Silero VAD model is loaded lazily on first use; silence is
+                # filtered out entirely, so this pass only initializes the VAD.
+                # WhisperS2T runs its own VAD and ignores vad_filter
+                segments, _ = model.transcribe(silence, beam_size=1, vad_filter=True)
+                list(segments)
+            print(f"Model {model_name} warmed up.")
+        except Exception as e:
+            print(f"Warm-up of model {model_name} failed: {e}")
+
     def notify(self, title, message, icon="dialog-information", timeout=2000):
         """Send a desktop notification."""
-        if not NOTIFICATIONS:
+        if not self.config["notifications"]:
             return
+        if self.dbus:
+            try:
+                self._notify_dbus(title, message, icon, timeout)
+                return
+            except Exception as e:
+                print(f"D-Bus notification failed, using notify-send: {e}")
+                self.dbus = None
         subprocess.run(
             [
                 "notify-send",
@@ -170,37 +473,62 @@ class Dictation:
             capture_output=True
         )
 
+    def _notify_dbus(self, title, message, icon, timeout):
+        """Send a notification directly over the session bus."""
+        address = DBusAddress(
+            NOTIFICATIONS_ADDRESS,
+            bus_name=NOTIFICATIONS_INTERFACE,
+            interface=NOTIFICATIONS_INTERFACE
+        )
+        hints = {"x-canonical-private-synchronous": ("s", "soupawhisper")}
+        with self.dbus_lock:
+            # Replace the previous notification instead of stacking a new one
+            msg = new_method_call(
+                address, "Notify", "susssasa{sv}i",
+                ("SoupaWhisper", self.notification_id, icon, title, message, [], hints, timeout)
+            )
+            reply = self.dbus.send_and_get_reply(msg, timeout=1)
+            self.notification_id = unwrap_msg(reply)[0]
+
     def start_recording(self, language, model_name, hotkey):
         if self.recording:
             return
 
-        # Start loading model if not yet loaded (non-blocking)
-        self._get_or_load_model(model_name)
-
         self.recording = True
         self.active_language = language
         self.active_model_name = model_name
-        self.temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        self.temp_file.close()
+        self.audio_buffer = bytearray()
 
         # Record using arecord (ALSA) - works on most Linux systems
+        # Raw PCM is streamed over stdout and kept in memory
         self.record_process = subprocess.Popen(
             [
                 "arecord",
                 "-f", "S16_LE",  # Format: 16-bit little-endian
-                "-r", "16000",   # Sample rate: 16kHz (what Whisper expects)
+                "-r", str(SAMPLE_RATE),
                 "-c", "1",       # Mono
-                "-t", "wav",
-                self.temp_file.name
+                "-t", "raw",
             ],
-            stdout=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL
         )
+        self.record_thread = threading.Thread(
+            target=self._read_audio,
+            args=(self.record_process.stdout, self.audio_buffer),
+            daemon=True
+        )
+        self.record_thread.start()
         lang_display = "auto-detect" if language == "auto" else language.upper()
         hotkey_name = hotkey.name if hasattr(hotkey, 'name') else hotkey.char
         print(f"Recording ({lang_display})...")
         self.notify(f"Recording ({lang_display})...", f"Release {hotkey_name.upper()} when done", "audio-input-microphone", 30000)
 
+    def _read_audio(self, stream, buffer):
+        """Append raw PCM from the recorder's stdout to the buffer until EOF."""
+        for chunk in iter(lambda: stream.read(4096), b""):
+            buffer.extend(chunk)
+        stream.close()
+
     def stop_recording(self):
         if not self.recording:
             return
@@ -211,12 +539,100 @@ class Dictation:
             self.record_process.terminate()
             self.record_process.wait()
             self.record_process = None
+        if self.record_thread:
+            self.record_thread.join()
+            self.record_thread = None
+
+        # Take ownership of the captured audio so it's freed after this dictation
+        audio_buffer = self.audio_buffer
+        self.audio_buffer = None
+
+        # Judge by the captured audio itself (16-bit samples), which also
+        # catches an empty capture when arecord couldn't open the device
+        if len(audio_buffer) < MIN_RECORDING_SECONDS * SAMPLE_RATE * 2:
+            print("Recording too short, skipped")
+            self.notify("Too short", "Hold the key while speaking", "dialog-warning", 1500)
+            return
 
         print("Transcribing...")
         self.notify("Transcribing...", "Processing your speech", "emblem-synchronizing", 30000)
 
+        # Hand off to the transcription worker so the key listener stays responsive
+        self.pending.put((audio_buffer, self.active_language, self.active_model_name))
+
+    def _transcription_worker(self):
+        """Transcribe finished recordings in order, batching any that queued up."""
+        while self.running:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                if len(batch) == 1:
+                    # Only one transcription is in flight, so the shared buffer is safe to use
+                    texts = [self._transcribe(*batch[0], reuse_buffer=True)]
+                else:
+                    texts = self._transcribe_batch(batch)
+
+                for text in texts:
+                    if text is not None:
+                        self._output(text)
+            except Exception as e:
+                # Keep the worker alive, otherwise later dictations would never complete
+                print(f"Error: {e}")
+                try:
+                    self.notify("Error", str(e)[:50], "dialog-error", 3000)
+                except Exception:
+                    pass
+
+    def _transcribe_batch(self, batch):
+        """Transcribe several recordings at once, keeping their order."""
+        model_names = {model_name for _, _, model_name in batch}
+        if len(model_names) == 1:
+            model_info = self._get_or_load_model(model_names.pop())
+            model_info["loaded"].wait()
+            if hasattr(model_info["model"], "transcribe_batch"):
+                try:
+                    audios = [self._to_float32(audio_buffer) for audio_buffer, _, _ in batch]
+                    languages = [language for _, language, _ in batch]
+                    return [self._join_segments(segments)
+                            for segments in model_info["model"].transcribe_batch(audios, languages)]
+                except Exception as e:
+                    print(f"Batch transcription failed, transcribing one by one: {e}")
+
+        # Concurrent requests against one model run in parallel with num_workers > 1
+        with ThreadPoolExecutor(max_workers=self.config["num_workers"]) as executor:
+            return list(executor.map(lambda item: self._transcribe(*item), batch))
+
+    def _to_float32(self, audio_buffer, reuse_buffer=False):
+        """Convert 16-bit PCM to float32 in [-1, 1] in a single pass.
+
+        With reuse_buffer, recordings that fit are converted into a float32
+        buffer shared across dictations, only valid until the next call.
+        Longer recordings get a one-off array so the shared buffer never grows.
+        """
+        samples = np.frombuffer(audio_buffer, dtype=np.int16)
+        if not reuse_buffer or len(samples) > len(self.audio_f32):
+            return np.multiply(samples, PCM_SCALE, dtype=np.float32)
+        out = self.audio_f32[:len(samples)]
+        np.multiply(samples, PCM_SCALE, out=out)
+        return out
+
+    def _join_segments(self, segments):
+        parts = []
+        for segment in segments:
+            segment_text = segment.text.strip()
+            if segment_text:
+                parts.append(segment_text)
+        return " ".join(parts)
+
+    def _transcribe(self, audio_buffer, language, model_name, reuse_buffer=False):
+        """Transcribe one recording. Returns None if it failed."""
         # Get the model for this language
-        model_info = self._get_or_load_model(self.active_model_name)
+        model_info = self._get_or_load_model(model_name)
 
         # Wait for model if not loaded yet
         model_info["loaded"].wait()
@@ -224,59 +640,66 @@ class Dictation:
         if model_info["error"]:
             print(f"Cannot transcribe: model failed to load")
             self.notify("Error", "Model failed to load", "dialog-error", 3000)
-            return
+            return None
 
         # Transcribe with language setting
         try:
+            # Greedy decoding by default for low latency on short utterances,
+            # with temperature fallback when decoding fails
             transcribe_kwargs = {
-                "beam_size": 5,
+                "beam_size": self.config["beam_size"],
+                "best_of": 1,
+                "temperature": [0.0, 0.2, 0.4, 0.6],
+                "condition_on_previous_text": False,
                 "vad_filter": True,
+                "no_speech_threshold": 0.6,
             }
             # Only set language if not auto-detect and not using a .en model
-            if self.active_language and self.active_language != "auto":
-                if not self.active_model_name.endswith(".en"):
-                    transcribe_kwargs["language"] = self.active_language
+            if language and language != "auto":
+                if not model_name.endswith(".en"):
+                    transcribe_kwargs["language"] = language
 
             segments, info = model_info["model"].transcribe(
-                self.temp_file.name,
+                self._to_float32(audio_buffer, reuse_buffer),
                 **transcribe_kwargs,
             )
-
-            text = " ".join(segment.text.strip() for segment in segments)
-
-            if text:
-                # Copy to clipboard using xclip
-                process = subprocess.Popen(
-                    ["xclip", "-selection", "clipboard"],
-                    stdin=subprocess.PIPE
-                )
-                process.communicate(input=text.encode())
-
-                # Type it into the active input field
-                if AUTO_TYPE:
-                    subprocess.run(["xdotool", "type", "--clearmodifiers", text])
-
-                print(f"Copied: {text}")
-                self.notify("Copied!", text[:100] + ("..." if len(text) > 100 else ""), "emblem-ok-symbolic", 3000)
-            else:
-                print("No speech detected")
-                self.notify("No speech detected", "Try speaking louder", "dialog-warning", 2000)
+            return self._join_segments(segments)
 
         except Exception as e:
             print(f"Error: {e}")
             self.notify("Error", str(e)[:50], "dialog-error", 3000)
-        finally:
-            # Cleanup temp file
-            if self.temp_file and os.path.exists(self.temp_file.name):
-                os.unlink(self.temp_file.name)
+            return None
+
+    def _output(self, text):
+        """Copy the transcription to the clipboard and type it."""
+        if text:
+            # Copy to clipboard using xclip (wl-copy on Wayland)
+            process = subprocess.Popen(CLIPBOARD_CMD, stdin=subprocess.PIPE)
+            process.communicate(input=text.encode())
+
+            print(f"Copied: {text}")
+            self.notify("Copied!", text[:100] + ("..." if len(text) > 100 else ""), "emblem-ok-symbolic", 3000)
+
+            # Type it into the active input field after notifying, so the
+            # notification isn't delayed. This runs on the worker thread, so
+            # batched texts are typed one after another in order. Text is
+            # passed on stdin to avoid argv limits, without per-key delay
+            if self.config["auto_type"]:
+                subprocess.run(TYPE_CMD, input=text.encode())
+        else:
+            print("No speech detected")
+            self.notify("No speech detected", "Try speaking louder", "dialog-warning", 2000)
 
     def on_press(self, key):
-        if key in HOTKEY_TO_LANG:
-            config = HOTKEY_TO_LANG[key]
-            self.start_recording(config["lang"], config["model"], key)
+        # Called for every key press system-wide (and auto-repeat while the
+        # hotkey is held), so bail out as cheaply as possible
+        if self.recording or key not in self.hotkeys:
+            return
+        config = self.hotkey_to_lang[key]
+        self.start_recording(config["lang"], config["model"], key)
 
     def on_release(self, key):
-        if key in HOTKEY_TO_LANG and self.recording:
+        if self.recording and key in self.hotkeys:
             self.stop_recording()
 
     def stop(self):
@@ -296,14 +719,13 @@ def check_dependencies():
     """Check that required system commands are available."""
     missing = []
 
-    for cmd in ["arecord", "xclip"]:
-        if subprocess.run(["which", cmd], capture_output=True).returncode != 0:
-            pkg = "alsa-utils" if cmd == "arecord" else cmd
-            missing.append((cmd, pkg))
+    required = [("arecord", "alsa-utils"), CLIPBOARD_PKG]
+    if get_config()["auto_type"]:
+        required.append(TYPE_PKG)
 
-    if AUTO_TYPE:
-        if subprocess.run(["which", "xdotool"], capture_output=True).returncode != 0:
-            missing.append(("xdotool", "xdotool"))
+    for cmd, pkg in required:
+        if shutil.which(cmd) is None:
+            missing.append((cmd, pkg))
 
     if missing:
         print("Missing dependencies:")
@@ -325,6 +747,8 @@ def main():
 
     print(f"SoupaWhisper v{__version__}")
     print(f"Config: {CONFIG_PATH}")
+    config = get_config()
+    print(f"Device: {config['device']} (compute type: {config['compute_type']})")
 
     check_dependencies()
 
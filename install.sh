@@ -26,6 +26,12 @@ detect_package_manager() {
 # Install system dependencies
 install_deps() {
     local pm=$(detect_package_manager)
+    local wayland_pkgs=""
+
+    # Native Wayland clipboard and typing tools
+    if [ "$XDG_SESSION_TYPE" = "wayland" ]; then
+        wayland_pkgs="wl-clipboard wtype"
+    fi
 
     echo "Detected package manager: $pm"
     echo "Installing system dependencies..."
@@ -33,20 +39,20 @@ install_deps() {
     case $pm in
         apt)
             sudo apt update
-            sudo apt install -y alsa-utils xclip xdotool libnotify-bin
+            sudo apt install -y alsa-utils xclip xdotool libnotify-bin $wayland_pkgs
             ;;
         dnf)
-            sudo dnf install -y alsa-utils xclip xdotool libnotify
+            sudo dnf install -y alsa-utils xclip xdotool libnotify $wayland_pkgs
             ;;
         pacman)
-            sudo pacman -S --noconfirm alsa-utils xclip xdotool libnotify
+            sudo pacman -S --noconfirm alsa-utils xclip xdotool libnotify $wayland_pkgs
             ;;
         zypper)
-            sudo zypper install -y alsa-utils xclip xdotool libnotify-tools
+            sudo zypper install -y alsa-utils xclip xdotool libnotify-tools $wayland_pkgs
             ;;
         *)
             echo "Unknown package manager. Please install manually:"
-            echo "  alsa-utils xclip xdotool libnotify"
+            echo "  alsa-utils xclip xdotool libnotify $wayland_pkgs"
             ;;
     esac
 }
@@ -89,8 +95,14 @@ install_service() {
     # Get current display settings
     local display="${DISPLAY:-:0}"
     local xauthority="${XAUTHORITY:-$HOME/.Xauthority}"
+    local session_env=""
     local venv_path="$SCRIPT_DIR/.venv"
 
+    if [ "$XDG_SESSION_TYPE" = "wayland" ]; then
+        session_env="Environment=XDG_SESSION_TYPE=wayland
+Environment=WAYLAND_DISPLAY=${WAYLAND_DISPLAY:-wayland-0}"
+    fi
+
     # Check if venv exists
     if [ ! -d "$venv_path" ]; then
         venv_path=$(poetry env info --path 2>/dev/null || echo "$SCRIPT_DIR/.venv")
@@ -111,6 +123,7 @@ RestartSec=5
 # X11 display access
 Environment=DISPLAY=$display
 Environment=XAUTHORITY=$xauthority
+$session_env
 
 [Install]
 WantedBy=default.target